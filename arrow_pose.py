@@ -0,0 +1,23 @@
+"""Arrow poses rebuilt from precomputed trajectory frames.
+
+The generated scenes import this module. Moving an arrow with
+put_start_and_end_on rotates and scales its previous pose, which points
+vectors the wrong way after they pass through zero and rescales the tip.
+Rebuilding the arrow from each frame keeps Manim's usual tip sizing.
+"""
+import numpy as np
+from manim import RIGHT, Arrow
+
+ZERO_LENGTH = 1e-6
+
+def vector_arrow(origin, end, color):
+    """Arrow from origin to end, hidden when the vector has zero length"""
+    origin = np.asarray(origin, dtype=np.float64)
+    if np.linalg.norm(np.asarray(end) - origin) > ZERO_LENGTH:
+        return Arrow(origin, end, buff=0, color=color)
+    # Tiny invisible arrow: keeps the mobject valid until the vector grows again
+    return Arrow(origin, origin + 0.01 * RIGHT, buff=0, color=color).set_opacity(0)
+
+def move_arrow(arrow, origin, end):
+    """Point arrow from origin to end, independent of its previous pose"""
+    return arrow.become(vector_arrow(origin, end, arrow.get_color()))
@@ -0,0 +1,104 @@
+"""Number readouts assembled from glyphs rendered once.
+
+The generated sweep scene imports this module. All digit glyphs come from
+a single LaTeX compile; a readout slot changes digit by copying a glyph's
+points, so values can change every frame without recompiling LaTeX or
+creating new mobjects.
+"""
+import numpy as np
+from manim import DOWN, LEFT, RIGHT, UP, WHITE, Line, MathTex, Rectangle, VGroup, VMobject
+
+GLYPH_CHARS = "0123456789-."
+
+_glyph_templates = {}
+
+def glyph_templates():
+    """Points of each readout character, centred per glyph on the digit baseline"""
+    if not _glyph_templates:
+        tex = MathTex(*GLYPH_CHARS)
+        zero_center_y = tex[0].get_center()[1]
+        for char, part in zip(GLYPH_CHARS, tex):
+            points = np.vstack([m.points for m in part.family_members_with_points()])
+            _glyph_templates[char] = points - np.array([part.get_center()[0], zero_center_y, 0])
+    return _glyph_templates
+
+def format_number(value, decimals):
+    """Readout text for `value`, avoiding a "-0.00" flicker around zero"""
+    text = f"{value:.{decimals}f}"
+    return text[1:] if text.startswith("-") and float(text) == 0 else text
+
+def number_width(values, decimals):
+    """Characters needed to show every value in `values`"""
+    return max(len(format_number(value, decimals)) for value in np.ravel(values))
+
+class GlyphNumber(VGroup):
+    """Fixed-width, right-aligned number whose digits are swapped from pre-rendered glyphs"""
+
+    def __init__(self, value=0.0, decimals=2, width=5, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        templates = glyph_templates()
+        self.decimals = decimals
+        self.char_count = width
+        self.advance = 1.1 * np.ptp(templates["0"][:, 0])
+
+        # Invisible frame carries position and scale for the slots
+        self.frame = Rectangle(
+            width=self.advance * width,
+            height=np.ptp(templates["0"][:, 1]),
+            stroke_opacity=0,
+            fill_opacity=0
+        )
+        self.base_width = self.frame.width
+        self.slots = [VMobject(fill_color=color, fill_opacity=1, stroke_width=0) for _ in range(width)]
+        self.add(self.frame, *self.slots)
+
+        self.text = None
+        self.set_value(value)
+
+    def set_value(self, value):
+        text = format_number(value, self.decimals).rjust(self.char_count)
+        if len(text) > self.char_count:
+            raise ValueError(f"{text} does not fit in {self.char_count} characters")
+
+        templates = glyph_templates()
+        scale = self.frame.width / self.base_width
+        left = self.frame.get_left()
+        for i, char in enumerate(text):
+            # Only slots whose character changed are touched
+            if self.text is not None and self.text[i] == char:
+                continue
+            if char == " ":
+                self.slots[i].set_points(np.zeros((0, 3)))
+            else:
+                center = left + (i + 0.5) * self.advance * scale * RIGHT
+                self.slots[i].set_points(templates[char] * scale + center)
+        self.text = text
+        return self
+
+class GlyphMatrix(VGroup):
+    """Bracketed grid of GlyphNumbers for a matrix readout"""
+
+    def __init__(self, matrix, decimals=2, width=5, **kwargs):
+        super().__init__(**kwargs)
+        matrix = np.asarray(matrix)
+        rows, cols = matrix.shape
+        self.entries = VGroup(*[
+            GlyphNumber(value, decimals, width) for value in matrix.ravel()
+        ]).arrange_in_grid(rows, cols, buff=(0.35, 0.25))
+
+        # Plain line brackets avoid another LaTeX compile
+        brackets = VGroup()
+        for side, inward in ((LEFT, RIGHT), (RIGHT, LEFT)):
+            top = self.entries.get_corner(UP + side) + 0.15 * (UP + side)
+            bottom = self.entries.get_corner(DOWN + side) + 0.15 * (DOWN + side)
+            brackets.add(
+                Line(top, bottom),
+                Line(top, top + 0.12 * inward),
+                Line(bottom, bottom + 0.12 * inward)
+            )
+        self.add(self.entries, brackets)
+
+    def set_value(self, matrix):
+        for entry, value in zip(self.entries, np.ravel(matrix)):
+            entry.set_value(value)
+        return self
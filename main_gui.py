@@ -1,11 +1,17 @@
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import messagebox, ttk, filedialog
 import numpy as np
 import subprocess
 import os
 import platform
 import sys
 import shutil
+import hashlib
+import ast
+from trajectory_engine import INTERPOLATION_PATHS
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+RENDER_FRAME_RATE = 15  # Frames per second of the low-quality (-ql) render
 
 def verify_setup():
     """Check if setup was completed"""
@@ -84,6 +90,7 @@ def run_manim_visualization():
             sys.executable,
             "-m", "manim",
             "-ql",  # Medium quality
+            "--frame_rate", str(RENDER_FRAME_RATE),
             "--progress_bar=none",
             "--disable_caching",
             "matrix_visualization.py",
@@ -197,6 +204,101 @@ def parse_matrix(matrix_str, rows, cols):
     except Exception as e:
         raise ValueError(f"Error parsing matrix: {e}")
 
+# Parameter sweeps: matrix entries may be expressions in t
+SWEEP_RUN_TIME = 6  # Seconds for one pass through the matrix family
+SWEEP_FRAMES = SWEEP_RUN_TIME * RENDER_FRAME_RATE + 1  # Family members evaluated, one per frame
+SWEEP_NAMESPACE = {
+    name: getattr(np, name)
+    for name in ("sin", "cos", "tan", "arcsin", "arccos", "arctan",
+                 "sinh", "cosh", "tanh", "exp", "log", "sqrt", "abs")
+}
+SWEEP_NAMESPACE.update(pi=np.pi, e=np.e)
+SWEEP_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+    ast.Pow: np.power,
+    ast.USub: np.negative,
+    ast.UAdd: np.positive,
+}
+
+def evaluate_sweep_expression(expression, params):
+    """Evaluate an arithmetic expression in t, allowing only whitelisted names and functions"""
+    def evaluate(node):
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return float(node.value)
+        if isinstance(node, ast.Name):
+            if node.id == "t":
+                return params
+            if node.id in SWEEP_NAMESPACE and not callable(SWEEP_NAMESPACE[node.id]):
+                return SWEEP_NAMESPACE[node.id]
+            raise ValueError(f"Unknown name '{node.id}'")
+        if isinstance(node, ast.BinOp) and type(node.op) in SWEEP_OPERATORS:
+            return SWEEP_OPERATORS[type(node.op)](evaluate(node.left), evaluate(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in SWEEP_OPERATORS:
+            return SWEEP_OPERATORS[type(node.op)](evaluate(node.operand))
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and callable(SWEEP_NAMESPACE.get(node.func.id)) and not node.keywords):
+            return SWEEP_NAMESPACE[node.func.id](*[evaluate(arg) for arg in node.args])
+        raise ValueError(f"Unsupported expression: {expression}")
+
+    return evaluate(ast.parse(expression, mode="eval").body)
+
+def split_matrix_row(line):
+    """Split a row into entries: spaces separate entries unless inside parentheses
+    or around a binary operator, so "1 - t" is one entry and "1 -t" is two"""
+    entries = []
+    current = ""
+    depth = 0
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if char.isspace() and depth == 0:
+            j = i
+            while j < len(line) and line[j].isspace():
+                j += 1
+            prev, following, after = current[-1:], line[j:j + 1], line[j + 1:j + 2]
+            ends_operand = prev.isalnum() or prev in "_.)"
+            starts_operand = (following.isalnum() or following in "_.(" or
+                              (following in "+-" and after != "" and not after.isspace()))
+            if ends_operand and starts_operand:
+                entries.append(current)
+                current = ""
+            i = j
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        current += char
+        i += 1
+    if current:
+        entries.append(current)
+    return entries
+
+def parse_matrix_family(matrix_str, rows, cols, params):
+    """Evaluate a matrix of expressions in t for every parameter value at once"""
+    try:
+        lines = [line.strip() for line in matrix_str.strip().split('\n') if line.strip()]
+
+        if len(lines) != rows:
+            raise ValueError(f"Expected {rows} rows, got {len(lines)}")
+
+        # Each entry is evaluated once over the whole parameter array
+        entries = []
+        for line in lines:
+            elements = split_matrix_row(line)
+            if len(elements) != cols:
+                raise ValueError(f"Expected {cols} columns in each row, got {len(elements)}")
+            for element in elements:
+                value = evaluate_sweep_expression(element, params)
+                entries.append(np.broadcast_to(np.asarray(value, dtype=np.float64), params.shape))
+
+        return np.stack(entries, axis=-1).reshape(len(params), rows, cols)
+    except Exception as e:
+        raise ValueError(f"Error parsing matrix: {e}")
+
 def matrix_to_latex_str(matrix):
     """Convert numpy matrix to valid LaTeX"""
     rows, cols = matrix.shape
@@ -206,7 +308,206 @@ def matrix_to_latex_str(matrix):
         elements.append(" & ".join([f"{x:.2f}".rstrip('0').rstrip('.') if '.' in f"{x:.2f}" else f"{x}" for x in row]))
     return r"\begin{bmatrix} " + r" \\ ".join(elements) + r" \end{bmatrix}"
 
-def create_manim_file(matrix1, matrix2, point):
+# Large point-set handling
+POINT_CHUNK_SIZE = 100_000  # Points transformed per chunk, keeps memory bounded
+VISUAL_POINT_BUDGET = 2000  # Max points drawn in the animation
+POINT_CACHE_DIR = os.path.join(APP_DIR, "point_cache")
+POINT_TEXT_EXTENSIONS = (".csv", ".txt", ".xyz")
+POINT_MESH_EXTENSIONS = (".obj", ".ply")
+
+def iter_point_rows(filepath, dim):
+    """Yield the first `dim` coordinates of each point in a text point/mesh file"""
+    ext = os.path.splitext(filepath)[1].lower()
+    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+        if ext == ".ply":
+            # ASCII PLY: read the vertex count from the header, then the vertex block
+            vertex_count = 0
+            for line in f:
+                words = line.split()
+                if words[:1] == ["format"] and words[1:2] != ["ascii"]:
+                    raise ValueError("Only ASCII PLY files are supported")
+                if words[:2] == ["element", "vertex"]:
+                    vertex_count = int(words[2])
+                if words == ["end_header"]:
+                    break
+            for i in range(vertex_count):
+                line = f.readline()
+                if not line:
+                    raise ValueError(f"PLY file ends after {i} of {vertex_count} vertices")
+                row = [float(num) for num in line.split()[:dim]]
+                if len(row) != dim:
+                    raise ValueError(f"Expected {dim} coordinates per point, got {len(row)}")
+                yield row
+            return
+
+        rows_read = 0
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if ext == ".obj":
+                # Only vertex lines carry positions
+                if not line.startswith("v "):
+                    continue
+                values = line.split()[1:dim + 1]
+            else:
+                values = line.replace(",", " ").split()[:dim]
+            try:
+                row = [float(num) for num in values]
+            except ValueError:
+                if rows_read == 0:
+                    continue  # Header line
+                raise ValueError(f"Invalid point on line: {line}")
+            if len(row) != dim:
+                raise ValueError(f"Expected {dim} coordinates per point, got {len(row)}")
+            rows_read += 1
+            yield row
+
+def convert_point_file_to_npy(filepath, dim):
+    """Convert a text point/mesh file to a cached .npy file, one chunk at a time"""
+    os.makedirs(POINT_CACHE_DIR, exist_ok=True)
+
+    # Key the cache on the full path and file state, so same-named files never collide
+    source = os.path.abspath(filepath)
+    info = os.stat(source)
+    source_key = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    state_key = hashlib.sha1(f"{info.st_size}|{info.st_mtime_ns}".encode("utf-8")).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(filepath))[0]
+    prefix = f"{stem}_{dim}d_{source_key}_"
+    npy_path = os.path.join(POINT_CACHE_DIR, f"{prefix}{state_key}.npy")
+    if os.path.exists(npy_path):
+        return npy_path
+
+    # First pass counts points so the output can be preallocated on disk
+    count = sum(1 for _ in iter_point_rows(filepath, dim))
+    if count == 0:
+        raise ValueError(f"No points found in {filepath}")
+
+    # Write to a temp file and move it into place only once complete,
+    # so an interrupted conversion never leaves a valid-looking cache entry
+    tmp_path = f"{npy_path}.{os.getpid()}.tmp"
+    try:
+        out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float64, shape=(count, dim))
+        start = 0
+        chunk = []
+        for row in iter_point_rows(filepath, dim):
+            chunk.append(row)
+            if len(chunk) == POINT_CHUNK_SIZE:
+                out[start:start + len(chunk)] = chunk
+                start += len(chunk)
+                chunk = []
+        if chunk:
+            out[start:start + len(chunk)] = chunk
+        out.flush()
+        del out
+        os.replace(tmp_path, npy_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Evict conversions of older versions of the same source file
+    for name in os.listdir(POINT_CACHE_DIR):
+        stale = os.path.join(POINT_CACHE_DIR, name)
+        if name.startswith(prefix) and name.endswith(".npy") and stale != npy_path:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass  # Still memory-mapped elsewhere; retried on the next conversion
+    return npy_path
+
+def load_point_set(filepath, dim):
+    """Open a point set as a read-only memory-mapped (N, dim) array"""
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext == ".npy":
+        points = np.load(filepath, mmap_mode='r')
+    elif ext in POINT_TEXT_EXTENSIONS + POINT_MESH_EXTENSIONS:
+        points = np.load(convert_point_file_to_npy(filepath, dim), mmap_mode='r')
+    else:
+        raise ValueError(f"Unsupported point file type: {ext}")
+
+    if points.ndim != 2 or points.shape[1] < dim or len(points) == 0:
+        raise ValueError(f"Point set must have shape (N, {dim}), got {points.shape}")
+    return points[:, :dim]
+
+def transform_point_set(points, matrix, out_path, chunk_size=POINT_CHUNK_SIZE):
+    """Write matrix @ p for every point to an .npy file without loading the full set"""
+    out = np.lib.format.open_memmap(out_path, mode="w+", dtype=np.float64, shape=points.shape)
+    for start in range(0, len(points), chunk_size):
+        stop = min(start + chunk_size, len(points))
+        # Points are rows, so M @ p for each row is rows @ M.T
+        out[start:stop] = np.asarray(points[start:stop], dtype=np.float64) @ matrix.T
+    out.flush()
+    del out
+    return out_path
+
+def export_transformed_points(points, matrix1, matrix2, directory, stem):
+    """Export the point set transformed by A and by B x A as .npy files"""
+    paths = (
+        os.path.join(directory, f"{stem}_A.npy"),
+        os.path.join(directory, f"{stem}_BxA.npy"),
+    )
+    transform_point_set(points, matrix1, paths[0])
+    transform_point_set(points, np.dot(matrix2, matrix1), paths[1])
+    return paths
+
+def occupied_grid_cells(points, lo, span, cells_per_axis, chunk_size=POINT_CHUNK_SIZE, limit=None):
+    """First point index in each occupied cell of a uniform grid, stopping early past `limit` cells"""
+    n, dim = points.shape
+    grid_shape = (cells_per_axis,) * dim
+    cell_ids = np.zeros(0, dtype=np.int64)
+    indices = np.zeros(0, dtype=np.int64)
+    for start in range(0, n, chunk_size):
+        chunk = np.asarray(points[start:start + chunk_size])
+        rows = np.flatnonzero(np.isfinite(chunk).all(axis=1))
+        cells = ((chunk[rows] - lo) / span * cells_per_axis).astype(np.int64)
+        cells = np.clip(cells, 0, cells_per_axis - 1)
+        ids, first = np.unique(np.ravel_multi_index(cells.T, grid_shape), return_index=True)
+
+        # Earlier chunks come first, so np.unique keeps their index for shared cells
+        cell_ids, keep = np.unique(np.concatenate([cell_ids, ids]), return_index=True)
+        indices = np.concatenate([indices, start + rows[first]])[keep]
+        if limit is not None and len(cell_ids) >= limit:
+            break
+    return np.sort(indices)
+
+def downsample_points(points, budget=VISUAL_POINT_BUDGET, chunk_size=POINT_CHUNK_SIZE):
+    """Pick at most `budget` well-spread point indices using an adaptive uniform voxel grid"""
+    n, dim = points.shape
+    if n <= budget:
+        return np.flatnonzero(np.isfinite(np.asarray(points)).all(axis=1))
+
+    # Pass 1: bounding box, ignoring rows with NaN/inf
+    lo = np.full(dim, np.inf)
+    hi = np.full(dim, -np.inf)
+    for start in range(0, n, chunk_size):
+        chunk = np.asarray(points[start:start + chunk_size])
+        chunk = chunk[np.isfinite(chunk).all(axis=1)]
+        if len(chunk):
+            lo = np.minimum(lo, chunk.min(axis=0))
+            hi = np.maximum(hi, chunk.max(axis=0))
+    if not np.all(np.isfinite(lo)):
+        raise ValueError("Point set has no finite points")
+    span = np.where(hi > lo, hi - lo, 1.0)
+
+    # Refine the grid until enough cells are occupied: surfaces and curves
+    # fill far fewer cells than the full volume, so a fixed grid wastes the budget.
+    # A line of points needs `budget` cells per axis, which bounds the search.
+    low, high = int(np.ceil(budget ** (1.0 / dim))), budget
+    while low < high:
+        middle = (low + high) // 2
+        if len(occupied_grid_cells(points, lo, span, middle, chunk_size, limit=budget)) >= budget:
+            high = middle
+        else:
+            low = middle + 1
+
+    # Pass 2: keep the first point that lands in each grid cell
+    indices = occupied_grid_cells(points, lo, span, low, chunk_size)
+    if len(indices) > budget:
+        indices = indices[np.linspace(0, len(indices) - 1, budget).astype(np.int64)]
+    return indices
+
+def create_manim_file(matrix1, matrix2, point, point_cloud=None, interpolation_path="linear"):
     """Create a Manim script file for matrix visualization"""
     matrix1_latex = matrix_to_latex_str(matrix1)
     matrix2_latex = matrix_to_latex_str(matrix2)
@@ -403,11 +704,60 @@ class MatrixMultiplicationScene(ThreeDScene):
     result_matrix = np.dot(matrix2, matrix1)
     result_latex = matrix_to_latex_str(result_matrix)
 
+    # Downsampled point set is small enough to embed like the matrices
+    if point_cloud is None:
+        point_cloud_literal = "None"
+    else:
+        point_cloud_literal = f"np.array({np.round(point_cloud, 4).tolist()})"
+
+    if interpolation_path not in INTERPOLATION_PATHS:
+        raise ValueError(f"Unknown interpolation path: {interpolation_path}")
+
     script_content = f"""# -*- coding: utf-8 -*-
 from manim import *
 import numpy as np
+import sys
+
+sys.path.insert(0, r"{APP_DIR}")
+from trajectory_engine import stage_trajectory
+from arrow_pose import move_arrow
+
+INTERPOLATION_PATH = "{interpolation_path}"
 
 class MatrixMultiplicationScene(ThreeDScene):
+    def play_trajectory(self, axes, mobjects, start_points, matrix, run_time=1):
+        # Move arrows or a point cloud from start_points to matrix @ start_points along a precomputed path
+        frames = int(run_time * config.frame_rate) + 1
+        trajectory = stage_trajectory(start_points, matrix, frames, INTERPOLATION_PATH, smooth)
+
+        # Axes are linear, so map the whole (frames x points x 3) array to scene space at once
+        origin = axes.c2p(0, 0, 0)
+        basis = np.array([axes.c2p(*unit) for unit in np.eye(3)]) - origin
+        scene_trajectory = origin + trajectory @ basis
+        last_frame = len(scene_trajectory) - 1
+        tracker = ValueTracker(0)
+
+        def frame_positions():
+            return scene_trajectory[int(round(tracker.get_value() * last_frame))]
+
+        def follow(index):
+            def update(arrow):
+                # Rebuilt from the frame itself, so vectors through zero keep the right direction
+                move_arrow(arrow, origin, frame_positions()[index])
+            return update
+
+        if isinstance(mobjects, PMobject):
+            # The whole point cloud moves with one vectorized write per frame
+            mobjects.add_updater(lambda cloud: cloud.set_points(frame_positions().copy()))
+            mobjects = [mobjects]
+        else:
+            # Only the few basis arrows get their own updater
+            for index, arrow in enumerate(mobjects):
+                arrow.add_updater(follow(index))
+        self.play(tracker.animate.set_value(1), run_time=run_time, rate_func=linear)
+        for mob in mobjects:
+            mob.clear_updaters()
+
     def construct(self):
         # Define matrices
         matrix1 = np.array({matrix1.tolist()})
@@ -459,6 +809,28 @@ class MatrixMultiplicationScene(ThreeDScene):
         self.move_camera(phi=45 * DEGREES, theta=-125 * DEGREES, run_time=1.5)
         self.wait(2)
         
+        # Optional: downsampled point set loaded from a file
+        point_cloud = {point_cloud_literal}
+        if point_cloud is not None:
+            # Pad 2D points with z=0 like the point vectors
+            cloud_points = point_cloud
+            if cloud_points.shape[1] == 2:
+                cloud_points = np.column_stack([cloud_points, np.zeros(len(cloud_points))])
+            # One point-cloud mobject instead of a Dot per point
+            cloud = PMobject(stroke_width=4)
+            cloud.add_points([axes.c2p(*p) for p in cloud_points], color=BLUE)
+
+            cloud_title = Tex("Point Set Transformation").scale(0.5).to_edge(UP)
+            self.play(Write(cloud_title), FadeIn(cloud))
+            self.wait(1)
+            self.play_trajectory(axes, cloud, point_cloud, matrix1, run_time=2)
+            cloud.set_color(GREEN)
+            self.wait(1)
+            self.play_trajectory(axes, cloud, point_cloud @ matrix1.T, matrix2, run_time=2)
+            cloud.set_color(YELLOW)
+            self.wait(1)
+            self.play(FadeOut(cloud), FadeOut(cloud_title))
+        
         if matrix1.shape == (3, 3):
             # 3D transformation logic
              
@@ -473,26 +845,15 @@ class MatrixMultiplicationScene(ThreeDScene):
             title1 = Tex("Transformation by Matrix $A$").scale(0.5).to_edge(UP)
             self.play(Write(title1))
 
-            new_i = Arrow(axes.c2p(0, 0, 0), axes.c2p(*matrix1[:, 0]), buff=0, color=RED)
-            new_j = Arrow(axes.c2p(0, 0, 0), axes.c2p(*matrix1[:, 1]), buff=0, color=GREEN)
-            new_k = Arrow(axes.c2p(0, 0, 0), axes.c2p(*matrix1[:, 2]), buff=0, color=BLUE)
-
-            self.play(Transform(i_hat, new_i), Transform(j_hat, new_j), Transform(k_hat, new_k))
+            self.play_trajectory(axes, [i_hat, j_hat, k_hat], np.eye(3), matrix1)
             self.wait(1)
 
             # Second transformation (matrix2)
             title2 = Tex("Transformation by Matrix $B$").scale(0.5).to_edge(UP)
             self.play(FadeOut(title1), Write(title2))
 
-            i_transformed = np.dot(matrix2, matrix1[:, 0])
-            j_transformed = np.dot(matrix2, matrix1[:, 1])
-            k_transformed = np.dot(matrix2, matrix1[:, 2])
-
-            final_i = Arrow(axes.c2p(0, 0, 0), axes.c2p(*i_transformed), buff=0, color=RED)
-            final_j = Arrow(axes.c2p(0, 0, 0), axes.c2p(*j_transformed), buff=0, color=GREEN)
-            final_k = Arrow(axes.c2p(0, 0, 0), axes.c2p(*k_transformed), buff=0, color=BLUE)
-
-            self.play(Transform(i_hat, final_i), Transform(j_hat, final_j), Transform(k_hat, final_k))
+            # Basis vectors start from the columns of A
+            self.play_trajectory(axes, [i_hat, j_hat, k_hat], matrix1.T, matrix2)
 
         else:
             # 2D logic
@@ -508,23 +869,15 @@ class MatrixMultiplicationScene(ThreeDScene):
             title1 = Tex("Transformation by Matrix $A$").scale(0.5).to_edge(UP)
             self.play(Write(title1))
 
-            new_i = Arrow(axes.c2p(0, 0), axes.c2p(matrix1[0, 0], matrix1[1, 0]), buff=0, color=RED)
-            new_j = Arrow(axes.c2p(0, 0), axes.c2p(matrix1[0, 1], matrix1[1, 1]), buff=0, color=GREEN)
-
-            self.play(Transform(i_hat, new_i), Transform(j_hat, new_j))
+            self.play_trajectory(axes, [i_hat, j_hat], np.eye(2), matrix1)
             self.wait(1)
 
             # Second transformation
             title2 = Tex("Transformation by Matrix $B$").scale(0.5).to_edge(UP)
             self.play(FadeOut(title1), Write(title2))
 
-            i_transformed = np.dot(matrix2, np.array([matrix1[0, 0], matrix1[1, 0]]))
-            j_transformed = np.dot(matrix2, np.array([matrix1[0, 1], matrix1[1, 1]]))
-
-            final_i = Arrow(axes.c2p(0, 0), axes.c2p(i_transformed[0], i_transformed[1]), buff=0, color=RED)
-            final_j = Arrow(axes.c2p(0, 0), axes.c2p(j_transformed[0], j_transformed[1]), buff=0, color=GREEN)
-
-            self.play(Transform(i_hat, final_i), Transform(j_hat, final_j))
+            # Basis vectors start from the columns of A
+            self.play_trajectory(axes, [i_hat, j_hat], matrix1.T, matrix2)
             self.wait(1)
 
             # Combined transformation
@@ -538,6 +891,93 @@ class MatrixMultiplicationScene(ThreeDScene):
     with open("matrix_visualization.py", "w", encoding="utf-8") as f:
         f.write(script_content)
 
+def create_sweep_manim_file(matrix1_family, matrix2_family, params, point):
+    """Create a Manim script that sweeps B(t) x A(t) over a parameter range"""
+    result_family = np.matmul(matrix2_family, matrix1_family)
+    if not np.all(np.isfinite(result_family)):
+        raise ValueError("Matrix family has non-finite values in the sweep range")
+
+    script_content = f"""# -*- coding: utf-8 -*-
+from manim import *
+import numpy as np
+import sys
+
+sys.path.insert(0, r"{APP_DIR}")
+from trajectory_engine import family_trajectory
+from arrow_pose import move_arrow, vector_arrow
+from glyph_readout import GlyphMatrix, GlyphNumber, number_width
+
+SWEEP_RUN_TIME = {SWEEP_RUN_TIME}
+
+class MatrixMultiplicationScene(ThreeDScene):
+    def construct(self):
+        # Matrix family sampled over the parameter range
+        params = np.array({params.tolist()})
+        result_family = np.array({np.round(result_family, 6).tolist()})
+        input_point = np.array({point.tolist()})
+        dim = result_family.shape[1]
+        
+        # Create coordinate system first
+        axes = ThreeDAxes(
+            x_range=[-5, 5, 1],
+            y_range=[-5, 5, 1],
+            z_range=[-5, 5, 1],
+            x_length=6,
+            y_length=6,
+            z_length=6
+        )
+        
+        # Animate creation of the axes
+        self.play(Create(axes), run_time=2)
+        self.wait(1)
+        
+        if dim == 3:
+            self.move_camera(phi=45 * DEGREES, theta=-125 * DEGREES, run_time=1.5)
+        
+        # The family holds one member per frame; track basis vectors and point through all of them
+        origin = axes.c2p(0, 0, 0)
+        basis = np.array([axes.c2p(*unit) for unit in np.eye(3)]) - origin
+        tracked = np.vstack([np.eye(dim), input_point])
+        scene_trajectory = origin + family_trajectory(tracked, result_family) @ basis
+        
+        colors = [RED, GREEN, BLUE][:dim] + [YELLOW]
+        # A zero-length start (zero point or column) is a hidden arrow that can still grow later
+        arrows = [vector_arrow(origin, end, color) for end, color in zip(scene_trajectory[0], colors)]
+        
+        # Readout is assembled from pre-rendered glyphs, no LaTeX compile per frame
+        decimals = 2
+        readout = GlyphMatrix(result_family[0], decimals, number_width(result_family, decimals))
+        param_readout = GlyphNumber(params[0], decimals, number_width(params, decimals))
+        panel = VGroup(
+            VGroup(MathTex(r"B(t) \\times A(t) ="), readout).arrange(RIGHT),
+            VGroup(MathTex("t ="), param_readout).arrange(RIGHT)
+        ).arrange(DOWN, aligned_edge=LEFT).scale(0.7).to_corner(UL)
+        self.add_fixed_in_frame_mobjects(panel)
+        
+        self.play(*[GrowArrow(arrow) for arrow in arrows])
+        self.wait(1)
+        
+        # Sweep through the family
+        tracker = ValueTracker(0)
+        last_frame = len(result_family) - 1
+        
+        def update_sweep(mob):
+            # Always show an actual family member, never a blend of two
+            frame = int(round(tracker.get_value() * last_frame))
+            for arrow, end in zip(arrows, scene_trajectory[frame]):
+                # Rebuilt from the frame itself, so sign changes keep the right direction
+                move_arrow(arrow, origin, end)
+            readout.set_value(result_family[frame])
+            param_readout.set_value(params[frame])
+        
+        panel.add_updater(update_sweep)
+        self.play(tracker.animate.set_value(1), run_time=SWEEP_RUN_TIME, rate_func=linear)
+        panel.clear_updaters()
+        self.wait(2)
+"""
+    with open("matrix_visualization.py", "w", encoding="utf-8") as f:
+        f.write(script_content)
+
 # GUI Setup
 root = tk.Tk()
 root.title("Matrix Transformation Visualizer")
@@ -614,6 +1054,98 @@ matrix2_text = tk.Text(matrix_frame, width=25, height=6)
 matrix2_text.grid(row=1, column=1, padx=5, pady=5)
 matrix2_text.insert("1.0", "2 0 0\n0 2 0\n0 0 2")  # Default scaling matrix
 
+# Parameter Sweep (matrix entries may use t, e.g. cos(t) -sin(t))
+sweep_frame = ttk.Frame(main_frame)
+sweep_frame.pack(fill=tk.X, pady=5)
+
+sweep_var = tk.BooleanVar(value=False)
+ttk.Checkbutton(sweep_frame, text="Sweep t from", variable=sweep_var).pack(side=tk.LEFT)
+sweep_start_var = tk.StringVar(value="0")
+ttk.Entry(sweep_frame, width=7, textvariable=sweep_start_var).pack(side=tk.LEFT, padx=5)
+ttk.Label(sweep_frame, text="to").pack(side=tk.LEFT)
+sweep_stop_var = tk.StringVar(value="6.2832")
+ttk.Entry(sweep_frame, width=7, textvariable=sweep_stop_var).pack(side=tk.LEFT, padx=5)
+
+def read_sweep_params():
+    """Read the sweep range from the GUI as one parameter value per rendered frame"""
+    start = float(sweep_start_var.get())
+    stop = float(sweep_stop_var.get())
+    return np.linspace(start, stop, SWEEP_FRAMES)
+
+# Point Set (optional large dataset transformed alongside the point)
+point_set_frame = ttk.Frame(main_frame)
+point_set_frame.pack(fill=tk.X, pady=5)
+
+loaded_point_set = {"path": None}
+
+def read_input_matrices():
+    """Read matrices A and B from the GUI"""
+    rows = int(rows_var.get())
+    cols = int(cols_var.get())
+    if not ((rows == 2 and cols == 2) or (rows == 3 and cols == 3)):
+        raise ValueError("Only 2x2 and 3x3 matrices are supported.")
+    matrix1 = parse_matrix(matrix1_text.get("1.0", "end-1c"), rows, cols)
+    matrix2 = parse_matrix(matrix2_text.get("1.0", "end-1c"), rows, cols)
+    return matrix1, matrix2
+
+def load_point_set_file():
+    try:
+        filepath = filedialog.askopenfilename(
+            title="Load Point Set",
+            filetypes=[
+                ("Point sets", "*.npy *.csv *.txt *.xyz *.obj *.ply"),
+                ("All files", "*.*")
+            ]
+        )
+        if not filepath:
+            return
+
+        status_label.config(text="Loading point set...")
+        root.update()
+
+        points = load_point_set(filepath, int(cols_var.get()))
+        loaded_point_set["path"] = filepath
+        point_set_label.config(text=f"{os.path.basename(filepath)} ({len(points):,} points)")
+        status_label.config(text="Ready")
+
+    except Exception as e:
+        status_label.config(text="Ready")
+        messagebox.showerror("Point Set Error", str(e))
+
+def clear_point_set():
+    loaded_point_set["path"] = None
+    point_set_label.config(text="No point set loaded")
+
+def export_point_set():
+    try:
+        if not loaded_point_set["path"]:
+            raise ValueError("Load a point set first.")
+
+        matrix1, matrix2 = read_input_matrices()
+        points = load_point_set(loaded_point_set["path"], matrix1.shape[1])
+
+        directory = filedialog.askdirectory(title="Export Transformed Points")
+        if not directory:
+            return
+
+        status_label.config(text="Exporting transformed points...")
+        root.update()
+
+        stem = os.path.splitext(os.path.basename(loaded_point_set["path"]))[0]
+        paths = export_transformed_points(points, matrix1, matrix2, directory, stem)
+        status_label.config(text="Export complete!")
+        messagebox.showinfo("Export Complete", "Saved:\n" + "\n".join(paths))
+
+    except Exception as e:
+        status_label.config(text="Export failed")
+        messagebox.showerror("Export Error", str(e))
+
+ttk.Button(point_set_frame, text="Load Point Set...", command=load_point_set_file).pack(side=tk.LEFT)
+ttk.Button(point_set_frame, text="Clear", command=clear_point_set).pack(side=tk.LEFT, padx=5)
+ttk.Button(point_set_frame, text="Export Transformed...", command=export_point_set).pack(side=tk.LEFT)
+point_set_label = ttk.Label(point_set_frame, text="No point set loaded")
+point_set_label.pack(side=tk.LEFT, padx=10)
+
 # Result
 result_frame = ttk.Frame(main_frame)
 result_frame.pack(fill=tk.X, pady=10)
@@ -647,15 +1179,36 @@ def calculate_matrices():
         # Parse matrices
         matrix1_str = matrix1_text.get("1.0", "end-1c")
         matrix2_str = matrix2_text.get("1.0", "end-1c")
-        matrix1 = parse_matrix(matrix1_str, rows, cols)
-        matrix2 = parse_matrix(matrix2_str, rows, cols)
-        result = np.dot(matrix2, matrix1)
 
-        result_text.delete("1.0", "end")
-        result_text.insert("1.0", np.array2string(result, precision=2, separator=' '))
+        if sweep_var.get():
+            # Sweep mode: evaluate the whole matrix family in one pass
+            params = read_sweep_params()
+            matrix1_family = parse_matrix_family(matrix1_str, rows, cols, params)
+            matrix2_family = parse_matrix_family(matrix2_str, rows, cols, params)
+            result_family = np.matmul(matrix2_family, matrix1_family)
 
-        # Visualization
-        create_manim_file(matrix1, matrix2, point)
+            result_text.delete("1.0", "end")
+            result_text.insert("1.0",
+                f"t = {params[0]:.2f}: {np.array2string(result_family[0], precision=2, separator=' ')}\n"
+                f"t = {params[-1]:.2f}: {np.array2string(result_family[-1], precision=2, separator=' ')}")
+
+            create_sweep_manim_file(matrix1_family, matrix2_family, params, point)
+        else:
+            matrix1 = parse_matrix(matrix1_str, rows, cols)
+            matrix2 = parse_matrix(matrix2_str, rows, cols)
+            result = np.dot(matrix2, matrix1)
+
+            result_text.delete("1.0", "end")
+            result_text.insert("1.0", np.array2string(result, precision=2, separator=' '))
+
+            # Downsample the loaded point set to the visual budget
+            point_cloud = None
+            if loaded_point_set["path"]:
+                points = load_point_set(loaded_point_set["path"], cols)
+                point_cloud = np.asarray(points[downsample_points(points)])
+
+            # Visualization
+            create_manim_file(matrix1, matrix2, point, point_cloud, interpolation_var.get())
 
         status_label.config(text="Generating visualization...")
         root.update()
@@ -674,6 +1227,17 @@ ttk.Button(
     command=calculate_matrices
 ).pack(side=tk.LEFT)
 
+# Interpolation path used for every transformation stage
+ttk.Label(button_frame, text="Interpolation:").pack(side=tk.LEFT, padx=(15, 5))
+interpolation_var = tk.StringVar(value="linear")
+ttk.Combobox(
+    button_frame,
+    width=8,
+    textvariable=interpolation_var,
+    values=INTERPOLATION_PATHS,
+    state="readonly"
+).pack(side=tk.LEFT)
+
 status_label = ttk.Label(main_frame, text="Ready")
 status_label.pack(fill=tk.X)
 
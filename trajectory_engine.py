@@ -0,0 +1,104 @@
+"""Precomputed per-frame trajectories for matrix transformation stages.
+
+The generated Manim scene imports this module. Each stage moves a set of
+vectors from v to M @ v; instead of letting Manim's Transform interpolate
+mobject points every frame, the whole (frames x points x 3) trajectory is
+computed up front with NumPy and mobjects are simply moved along it.
+"""
+import numpy as np
+from scipy.linalg import expm, logm, polar
+
+INTERPOLATION_PATHS = ("linear", "polar", "log")
+
+def linear_path(matrix, times):
+    """M(t) = (1 - t) I + t M"""
+    identity = np.eye(len(matrix))
+    return identity + times[:, None, None] * (matrix - identity)
+
+def rotation_path(rotation, times):
+    """Interpolate a 2D/3D rotation at constant angular speed"""
+    n = len(rotation)
+    identity = np.eye(n)
+    if n == 2:
+        angle = np.arctan2(rotation[1, 0], rotation[0, 0])
+        generator = np.array([[0.0, -1.0], [1.0, 0.0]])
+    else:
+        # Axis-angle form, Rodrigues' formula below
+        angle = np.arccos(np.clip((np.trace(rotation) - 1) / 2, -1.0, 1.0))
+        if np.isclose(angle, 0.0):
+            return np.broadcast_to(identity, (len(times), n, n)).copy()
+        if np.isclose(angle, np.pi):
+            # R + I has rank one, any non-zero column lies on the axis
+            columns = rotation + identity
+            axis = columns[:, np.argmax(np.linalg.norm(columns, axis=0))]
+        else:
+            axis = np.array([
+                rotation[2, 1] - rotation[1, 2],
+                rotation[0, 2] - rotation[2, 0],
+                rotation[1, 0] - rotation[0, 1],
+            ])
+        axis = axis / np.linalg.norm(axis)
+        generator = np.array([
+            [0.0, -axis[2], axis[1]],
+            [axis[2], 0.0, -axis[0]],
+            [-axis[1], axis[0], 0.0],
+        ])
+
+    theta = times[:, None, None] * angle
+    if n == 2:
+        return np.cos(theta) * identity + np.sin(theta) * generator
+    return identity + np.sin(theta) * generator + (1 - np.cos(theta)) * (generator @ generator)
+
+def polar_path(matrix, times):
+    """Rotate, then stretch: M = P R with R a rotation and P symmetric"""
+    rotation, stretch = polar(matrix, side="left")
+    identity = np.eye(len(matrix))
+
+    # A reflection cannot be reached by rotating, so flip the last axis first
+    # (flattening through it) and rotate what remains
+    flip = identity.copy()
+    if np.linalg.det(rotation) < 0:
+        flip[-1, -1] = -1.0
+        rotation = rotation @ flip
+
+    return (linear_path(stretch, times)
+            @ rotation_path(rotation, times)
+            @ linear_path(flip, times))
+
+def log_path(matrix, times):
+    """M(t) = expm(t logm(M)), falling back to the polar path when no real log exists"""
+    if np.linalg.det(matrix) <= 0:
+        return polar_path(matrix, times)
+    log_matrix = logm(matrix)
+    if np.iscomplexobj(log_matrix):
+        if np.abs(log_matrix.imag).max() > 1e-9:
+            return polar_path(matrix, times)
+        log_matrix = log_matrix.real
+    return expm(times[:, None, None] * log_matrix)
+
+PATH_FUNCTIONS = {
+    "linear": linear_path,
+    "polar": polar_path,
+    "log": log_path,
+}
+
+def stage_trajectory(points, matrix, frames, path="linear", rate_func=None):
+    """Positions of `points` (N x dim) moving to `points @ matrix.T`, as (frames, N, 3)"""
+    if path not in PATH_FUNCTIONS:
+        raise ValueError(f"Unknown interpolation path: {path}")
+
+    times = np.linspace(0.0, 1.0, max(int(frames), 2))
+    if rate_func is not None:
+        times = np.array([rate_func(t) for t in times])
+
+    matrix = np.asarray(matrix, dtype=np.float64)
+    return family_trajectory(points, PATH_FUNCTIONS[path](matrix, times))
+
+def family_trajectory(points, matrices):
+    """Positions of `points` (N x dim) under each of `matrices` (frames x dim x dim), as (frames, N, 3)"""
+    trajectory = np.einsum("fij,nj->fni", matrices, np.asarray(points, dtype=np.float64))
+
+    # Pad 2D trajectories with z=0 so the scene always gets 3D coordinates
+    if trajectory.shape[2] == 2:
+        trajectory = np.concatenate([trajectory, np.zeros(trajectory.shape[:2] + (1,))], axis=2)
+    return trajectory